@@ -56,21 +56,8 @@ filepaths = comm.bcast(filepaths, root=0)
 n_scans = len(filepaths)
 _logger.info(f"Number of scans locally: {n_scans}")
 
-collect_fires = []
-# loop through scans
-for i, scan_files in enumerate(filepaths):
-    # split by process
-    if i % size == rank:
-        try:
-            scan_fires = wildfire.parse_scan_for_wildfire(scan_files) # dict
-            if scan_fires is not None:
-                collect_fires.append(scan_fires)
-        except (OSError, ValueError) as error_message:
-            _logger.warning(
-                "\nSkipping malformed goes_scan comprised of %s.\nError: %s",
-                scan_files,
-                error_message,
-            )
+# split scans by process and loop through them, reading ahead in the background
+collect_fires = wildfire.parse_scans_for_wildfires(filepaths[rank::size])
 
 
 # send all fires to root node
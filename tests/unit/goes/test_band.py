@@ -31,7 +31,12 @@ def test_goes_band(reflective_band):
     with tempfile.TemporaryDirectory() as temp_directory:
         filepath = actual.to_netcdf(directory=temp_directory)
         assert os.path.exists(filepath)
-        assert isinstance(xr.open_dataset(filepath), xr.core.dataset.Dataset)
+        persisted = xr.load_dataset(filepath)
+        assert isinstance(persisted, xr.core.dataset.Dataset)
+        assert persisted.Rad.encoding["zlib"]
+        assert persisted.Rad.encoding["chunksizes"] == (512, 512)
+        assert persisted.Rad.encoding["dtype"] == actual.dataset.Rad.encoding["dtype"]
+        np.testing.assert_array_equal(persisted.Rad, actual.dataset.Rad)
 
 
 def test_reflective_band(reflective_band):
@@ -0,0 +1,91 @@
+import datetime
+import os
+import tempfile
+
+import pytest
+
+from wildfire.goes import downloader
+
+
+class _LocalFileSystem:
+    # Stands in for s3fs.S3FileSystem, "downloading" by copying local files.
+    def __init__(self):
+        self.num_downloads = 0
+
+    def info(self, path):
+        return {"size": os.path.getsize(path)}
+
+    def open(self, path, mode):
+        self.num_downloads += 1
+        return open(path, mode)
+
+
+def test_hour_prefixes():
+    actual = downloader._hour_prefixes(
+        start_time=datetime.datetime(2019, 10, 27, 20, 1),
+        end_time=None,
+        satellite="noaa-goes17",
+        region="M1",
+    )
+    assert actual == ["noaa-goes17/ABI-L1b-RadM/2019/300/20/"]
+
+    actual = downloader._hour_prefixes(
+        start_time=datetime.datetime(2019, 10, 27, 20, 50),
+        end_time=datetime.datetime(2019, 10, 27, 21, 10),
+        satellite="noaa-goes17",
+        region="M1",
+    )
+    assert actual == [
+        "noaa-goes17/ABI-L1b-RadM/2019/300/20/",
+        "noaa-goes17/ABI-L1b-RadM/2019/300/21/",
+    ]
+
+    actual = downloader._hour_prefixes(
+        start_time=datetime.datetime(2019, 10, 27, 20, 1),
+        end_time=datetime.datetime(2019, 10, 28, 20, 1),
+        satellite="noaa-goes17",
+        region="M1",
+    )
+    assert actual is None
+
+
+def test_get_if_missing(wildfire_scan_filepaths):
+    s3_filesystem = _LocalFileSystem()
+    with tempfile.TemporaryDirectory() as temporary_directory:
+        local_path = os.path.join(temporary_directory, "band.nc")
+        actual = [
+            downloader._get_if_missing(
+                s3_filesystem=s3_filesystem,
+                s3_filepath=wildfire_scan_filepaths[0],
+                local_path=local_path,
+            )
+            for _ in range(2)
+        ]
+        assert actual == [os.path.getsize(wildfire_scan_filepaths[0]), 0]
+        assert s3_filesystem.num_downloads == 1
+        assert os.listdir(temporary_directory) == ["band.nc"]
+
+        # Downloads get the same permissions as any other file created by the process.
+        umask = os.umask(0)
+        os.umask(umask)
+        assert os.stat(local_path).st_mode & 0o777 == 0o666 & ~umask
+
+        # A truncated file from an interrupted download is downloaded again.
+        with open(local_path, "r+b") as local_file:
+            local_file.truncate(10)
+        actual = downloader._get_if_missing(
+            s3_filesystem=s3_filesystem,
+            s3_filepath=wildfire_scan_filepaths[0],
+            local_path=local_path,
+        )
+        assert actual == os.path.getsize(wildfire_scan_filepaths[0])
+        assert os.path.getsize(local_path) == actual
+        assert s3_filesystem.num_downloads == 2
+
+        with pytest.raises(FileNotFoundError):
+            downloader._get_if_missing(
+                s3_filesystem=s3_filesystem,
+                s3_filepath="does_not_exist.nc",
+                local_path=os.path.join(temporary_directory, "missing.nc"),
+            )
+        assert os.listdir(temporary_directory) == ["band.nc"]
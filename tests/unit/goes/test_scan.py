@@ -21,6 +21,13 @@ def test_scan(all_bands_wildfire):
         filepaths = actual.to_netcdf(directory=temp_directory)
         for filepath in filepaths:
             assert os.path.exists(filepath)
+    with tempfile.TemporaryDirectory() as temp_directory:
+        parallel_filepaths = actual.to_netcdf(directory=temp_directory, num_workers=2)
+        assert [os.path.basename(filepath) for filepath in parallel_filepaths] == [
+            os.path.basename(filepath) for filepath in filepaths
+        ]
+        for filepath in parallel_filepaths:
+            assert os.path.exists(filepath)
 
 
 def test_scan_init_bad_args(all_bands_wildfire):
@@ -58,6 +65,26 @@ def test_read_netcdfs(wildfire_scan_filepaths):
     assert isinstance(actual, goes.GoesScan)
 
 
+def test_read_netcdfs_prefetched(wildfire_scan_filepaths, no_wildfire_scan_filepaths):
+    actual = list(
+        goes.scan.read_netcdfs_prefetched(
+            scans_filepaths=[
+                wildfire_scan_filepaths,
+                wildfire_scan_filepaths[:5],
+                no_wildfire_scan_filepaths,
+            ],
+            num_prefetched=1,
+        )
+    )
+    assert len(actual) == 3
+    assert actual[0].result().scan_time_utc == datetime.datetime(
+        2019, 10, 27, 20, 0, 27, 500000
+    )
+    with pytest.raises(ValueError):
+        actual[1].result()
+    assert isinstance(actual[2].result(), goes.GoesScan)
+
+
 def test_get_goes_scan_local(wildfire_scan_filepaths):
     local_filepath = wildfire_scan_filepaths
     region, _, satellite, scan_time = goes.utilities.parse_filename(
@@ -49,6 +49,15 @@ def test_imap_function():
         np.testing.assert_almost_equal(actual_elapsed_time, 1, decimal=0)
 
 
+def test_thread_map_function():
+    started_at = datetime.datetime.utcnow()
+    actual = utilities.thread_map_function(_timer, list(range(8)), max_workers=8)
+    assert actual == list(range(8))
+
+    actual_elapsed_time = (datetime.datetime.utcnow() - started_at).total_seconds()
+    np.testing.assert_almost_equal(actual_elapsed_time, 1, decimal=0)
+
+
 def test_map_function():
     num_cores = multiprocessing.cpu_count()
     if num_cores > 1:
@@ -134,6 +143,44 @@ def test_decide_fastest_glob_patterns():
     assert actual[0].count("*") == 4
 
 
+def test_format_scan_time():
+    actual = utilities.format_scan_time(
+        datetime.datetime(2019, 10, 27, 20, 48, 27, 599999)
+    )
+    assert actual == "20193002048275"
+    assert utilities.SCAN_START_REGEX.search(f"_s{actual}_e").group(1) == actual
+
+
+def test_scan_time_bounds():
+    actual = utilities.scan_time_bounds(
+        start_time=datetime.datetime(2019, 10, 27, 20, 0), end_time=None
+    )
+    assert actual == (20193002000000, 20193002000599)
+
+    actual = utilities.scan_time_bounds(
+        start_time=datetime.datetime(2019, 10, 27, 20, 0, 27, 450000),
+        end_time=datetime.datetime(2019, 10, 27, 20, 1, 0, 50000),
+    )
+    assert actual == (20193002000275, 20193002001000)
+
+
+def test_filter_filepaths(wildfire_scan_filepaths, no_wildfire_scan_filepaths):
+    filepaths = wildfire_scan_filepaths + no_wildfire_scan_filepaths
+    actual = utilities.filter_filepaths(
+        filepaths=filepaths,
+        start_time=datetime.datetime(2019, 10, 27, 20, 0, 27, 500000),
+        end_time=datetime.datetime(2019, 10, 27, 20, 1),
+    )
+    assert actual == wildfire_scan_filepaths
+
+    actual = utilities.filter_filepaths(
+        filepaths=filepaths,
+        start_time=datetime.datetime(2019, 10, 27, 20, 0, 27, 600000),
+        end_time=datetime.datetime(2019, 12, 1, 10, 28),
+    )
+    assert actual == no_wildfire_scan_filepaths
+
+
 def test_list_local_files(wildfire_scan_filepaths):
     actual = utilities.list_local_files(
         local_directory=os.path.join("tests", "resources", "test_scan_wildfire"),
@@ -29,6 +29,20 @@ def test_parse_scan_for_wildfire_bad_scan(wildfire_scan_filepaths):
     assert actual is None
 
 
+def test_parse_scans_for_wildfires(
+    wildfire_scan_filepaths, no_wildfire_scan_filepaths
+):
+    actual = wildfire.parse_scans_for_wildfires(
+        scans_filepaths=[
+            wildfire_scan_filepaths,
+            no_wildfire_scan_filepaths,
+            wildfire_scan_filepaths[:5],
+        ]
+    )
+    assert isinstance(actual, list)
+    assert len(actual) == 1
+
+
 def test_get_model_features_goes(all_bands_wildfire):
     goes_scan = goes.GoesScan(bands=all_bands_wildfire)
     actual = wildfire.get_model_features_goes(goes_scan=goes_scan)
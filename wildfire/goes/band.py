@@ -6,6 +6,9 @@ import xarray as xr
 
 from . import downloader, utilities
 
+NETCDF_CHUNK_SIZE = 512
+NETCDF_COMPRESSION = {"zlib": True, "complevel": 4, "shuffle": True}
+
 
 def get_goes_band(satellite, region, channel, scan_time_utc, local_directory, s3=True):
     """Read the GoesBand defined by parameters from the local filesystem or s3.
@@ -282,6 +285,8 @@ class GoesBand:
     def to_netcdf(self, directory):
         """Persist to netcdf4.
 
+        The image variables (`Rad` and `DQF`) are written chunked and zlib compressed.
+
         Persists file in a form matching the file struture in Amazon S3:
             {local_directory}/{s3_bucket_name}/{s3_key}
         For example:
@@ -308,7 +313,18 @@ class GoesBand:
             self.dataset.dataset_name,
         )
         os.makedirs(os.path.dirname(local_filepath), exist_ok=True)
-        self.dataset.to_netcdf(
+
+        # compress the image variables in chunks of at most 512 x 512 pixels, keeping
+        # the rest of their encoding (e.g. packing into scaled integers) as read
+        dataset = self.dataset.copy()
+        for variable in dataset.data_vars.values():
+            if variable.dims == ("y", "x"):
+                variable.encoding.update(
+                    chunksizes=tuple(min(NETCDF_CHUNK_SIZE, n) for n in variable.shape),
+                    contiguous=False,
+                    **NETCDF_COMPRESSION,
+                )
+        dataset.to_netcdf(
             path=local_filepath,
             encoding={"x": {"dtype": "float32"}, "y": {"dtype": "float32"}},
         )
@@ -11,21 +11,50 @@ variables `AWS_ACCESS_KEY_ID`, `AWS_SECRET_ACCESS_KEY` set. See this package's R
 or boto3's documentation at https://boto3.amazonaws.com/v1/documentation/api/latest/guide/configuration.html#shared-credentials-file for more information.
 """
 from collections import namedtuple
+import functools
 import logging
 import os
+import re
+import shutil
+import uuid
 
 import s3fs
 
 from . import utilities
 
 LOCAL_FILEPATH_FORMAT = "{local_directory}/{s3_key}"
-
-DownloadFileArgs = namedtuple(
-    "DownloadFileArgs", ("s3_filepath", "local_directory", "s3_filesystem")
+MAX_CONCURRENT_DOWNLOADS = 64
+COPY_BUFFER_SIZE = 1024 * 1024
+S3_FILENAME_PATTERN_FORMAT = (
+    r"OR_ABI-L1b-Rad{region}-M\dC{channel}_{satellite_short}_s(\d{{14}})_e.*_c.*\.nc$"
 )
+
+DownloadFileArgs = namedtuple("DownloadFileArgs", ("s3_filepath", "local_path"))
 _logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=1)
+def _s3fs():
+    """Get the `s3fs.S3FileSystem` shared by every call in this module.
+
+    Constructing a filesystem sets up a new boto session and an empty directory cache,
+    so reusing one instance lets repeated listings be served from its `dircache`. The
+    connection pool is sized to `MAX_CONCURRENT_DOWNLOADS` so that every download
+    thread reuses a kept-alive connection instead of opening a new one.
+
+    Files are only ever read front to back by downloads, so they are read ahead in
+    16 MB blocks rather than cached for random access.
+    """
+    return s3fs.S3FileSystem(
+        anon=True,
+        use_ssl=False,
+        default_block_size=16 * 1024 * 1024,
+        default_cache_type="readahead",
+        default_fill_cache=False,
+        config_kwargs={"max_pool_connections": MAX_CONCURRENT_DOWNLOADS},
+    )
+
+
 def list_s3_files(satellite, region, start_time, end_time=None, channel=None):
     """List NOAA GOES-R series files in Amazon S3 matching parameters.
 
@@ -47,7 +76,34 @@ def list_s3_files(satellite, region, start_time, end_time=None, channel=None):
     -------
     list of str
     """
-    s3 = s3fs.S3FileSystem(anon=True, use_ssl=False)
+    prefixes = _hour_prefixes(
+        start_time=start_time, end_time=end_time, satellite=satellite, region=region
+    )
+    if prefixes is not None:
+        _logger.info("Listing files in S3 under prefixes: %s", prefixes)
+        filename_regex = re.compile(
+            S3_FILENAME_PATTERN_FORMAT.format(
+                region=region,
+                channel=str(channel).zfill(2) if channel is not None else r"\d{2}",
+                satellite_short=utilities.SATELLITE_SHORT_HAND[satellite],
+            )
+        )
+        earliest, latest = utilities.scan_time_bounds(
+            start_time=start_time, end_time=end_time
+        )
+        if len(prefixes) == 1:
+            listed_filepaths = _s3fs().find(prefixes[0])
+        else:
+            listed_filepaths = utilities.thread_map_function(
+                _s3fs().find, prefixes, flatten=True
+            )
+        filepaths = []
+        for filepath in listed_filepaths:
+            match = filename_regex.search(filepath)
+            if match is not None and earliest <= int(match.group(1)) <= latest:
+                filepaths.append(filepath)
+        return filepaths
+
     glob_patterns = utilities.decide_fastest_glob_patterns(
         directory=satellite,
         satellite=satellite,
@@ -58,7 +114,7 @@ def list_s3_files(satellite, region, start_time, end_time=None, channel=None):
         s3=True,
     )
     _logger.info("Listing files in S3 using glob patterns: %s", glob_patterns)
-    filepaths = utilities.imap_function(s3.glob, glob_patterns, flatten=True)
+    filepaths = utilities.thread_map_function(_s3fs().glob, glob_patterns, flatten=True)
     if end_time is None:
         return filepaths
     return utilities.filter_filepaths(
@@ -66,15 +122,40 @@ def list_s3_files(satellite, region, start_time, end_time=None, channel=None):
     )
 
 
+def _hour_prefixes(start_time, end_time, satellite, region):
+    """Find the S3 hour prefixes containing every scan between the two times.
+
+    S3 keys are grouped by hour, and listing an hour prefix only returns the scans of
+    that hour. Broader prefixes are avoided: listing a whole day or year walks every
+    directory below it, which costs far more than listing the hours requested. For a
+    range spanning several days `None` is returned instead.
+
+    Returns
+    -------
+    list of str | None
+        e.g. ["noaa-goes17/ABI-L1b-RadM/2019/300/20/",
+              "noaa-goes17/ABI-L1b-RadM/2019/300/21/"]
+    """
+    if end_time is not None and start_time.date() != end_time.date():
+        return None
+
+    day_prefix = f"{satellite}/ABI-L1b-Rad{region[0]}/{start_time:%Y}/{start_time:%j}/"
+    last_hour = end_time.hour if end_time is not None else start_time.hour
+    return [f"{day_prefix}{hour:02d}/" for hour in range(start_time.hour, last_hour + 1)]
+
+
 def s3_filepath_to_local(s3_filepath, local_directory):
     """Translate s3fs filepath to local filesystem filepath."""
     _, key = s3fs.core.split_path(s3_filepath)
     return LOCAL_FILEPATH_FORMAT.format(local_directory=local_directory, s3_key=key)
 
 
-def download_file(s3_filepath, local_directory, s3_filesystem=None):
+def download_file(s3_filepath, local_directory):
     """Download file to disk.
 
+    Files already present at the local filepath are not downloaded again (see
+    `_get_if_missing()`).
+
     Local filepath will be of the form:
         {local_direcory}/{s3_key}
 
@@ -83,47 +164,77 @@ def download_file(s3_filepath, local_directory, s3_filesystem=None):
     str
         Local filepath to downloaded file.
     """
-    s3_filesystem = (
-        s3_filesystem
-        if s3_filesystem is not None
-        else s3fs.S3FileSystem(anon=True, use_ssl=False)
-    )
     local_path = s3_filepath_to_local(
         s3_filepath=s3_filepath, local_directory=local_directory
     )
     os.makedirs(name=os.path.dirname(local_path), exist_ok=True)
-    s3_filesystem.get(rpath=s3_filepath, lpath=local_path)
+    _get_if_missing(s3_filesystem=_s3fs(), s3_filepath=s3_filepath, local_path=local_path)
     return local_path
 
 
 def _download_file_mp(args):
     """Download file to disk.
 
-    Meant to be used in parallel by `utilities.imap_function()`
+    Meant to be used concurrently by `download_files()`, which is responsible for
+    resolving the local filepath and creating its directory before calling. Workers
+    share the module's filesystem from `_s3fs()` rather than receiving one per task.
 
-    Local filepath will be of the form:
-        {local_direcory}/{s3_key}
+    Returns
+    -------
+    tuple of (str, int)
+        Local filepath to downloaded file, and the number of bytes downloaded.
+    """
+    num_bytes = _get_if_missing(
+        s3_filesystem=_s3fs(), s3_filepath=args.s3_filepath, local_path=args.local_path,
+    )
+    return args.local_path, num_bytes
+
+
+def _get_if_missing(s3_filesystem, s3_filepath, local_path):
+    """Download `s3_filepath` to `local_path` unless it was downloaded before.
+
+    GOES-R objects are never rewritten in place (their keys embed the file's creation
+    time), so a file at `local_path` whose size matches the object's is taken to be a
+    complete copy. Object sizes come from `s3_filesystem.info()`, which is served from
+    the listing cache when the file was listed first. To keep partial files from ever
+    appearing at `local_path`, the object is downloaded to a ".part" file in the same
+    directory and atomically renamed into place.
 
     Returns
     -------
-    str
-        Local filepath to downloaded file.
+    int
+        Number of bytes downloaded, which is 0 if the file was already present.
     """
-    s3_filepath = args.s3_filepath
-    s3 = args.s3_filesystem
-    local_directory = args.local_directory
+    expected_size = s3_filesystem.info(s3_filepath)["size"]
+    if os.path.exists(local_path) and os.path.getsize(local_path) == expected_size:
+        return 0
 
-    local_path = s3_filepath_to_local(
-        s3_filepath=s3_filepath, local_directory=local_directory
-    )
-    os.makedirs(name=os.path.dirname(local_path), exist_ok=True)
-    s3.get(rpath=s3_filepath, lpath=local_path)
-    return local_path
+    temporary_path = f"{local_path}.{uuid.uuid4().hex}.part"
+    try:
+        with open(temporary_path, "wb") as local_file, s3_filesystem.open(
+            s3_filepath, "rb"
+        ) as remote_file:
+            shutil.copyfileobj(remote_file, local_file, COPY_BUFFER_SIZE)
+            num_bytes = local_file.tell()
+        os.replace(temporary_path, local_path)
+    except BaseException:
+        if os.path.exists(temporary_path):
+            os.remove(temporary_path)
+        raise
+    return num_bytes
 
 
 def download_files(local_directory, satellite, region, start_time, end_time=None):
     """Download files matching parameters to disk in parallel.
 
+    Files already present in `local_directory` are not downloaded again, so repeated
+    calls over overlapping time ranges only fetch what is missing.
+
+    Downloading is network-bound, so files are fetched by a pool of threads (see
+    `utilities.thread_map_function()`) sharing a single `s3fs.S3FileSystem`, which
+    keeps up to `MAX_CONCURRENT_DOWNLOADS` requests in flight without the cost of
+    forking and pickling for every file.
+
     Parameters
     ----------
     local_directory : str
@@ -141,26 +252,29 @@ def download_files(local_directory, satellite, region, start_time, end_time=None
     list of str
         Local filepaths to downloaded files.
     """
-    s3 = s3fs.S3FileSystem(anon=True, use_ssl=False)
-
     s3_filepaths = list_s3_files(
         satellite=satellite, region=region, start_time=start_time, end_time=end_time
     )
 
-    _logger.info(
-        "Downloading %d files using %d workers...", len(s3_filepaths), os.cpu_count()
-    )
-    local_filepaths = utilities.imap_function(
+    local_filepaths = [
+        s3_filepath_to_local(s3_filepath=s3_filepath, local_directory=local_directory)
+        for s3_filepath in s3_filepaths
+    ]
+    # scans share a handful of directories, so create each once rather than per file
+    for directory in {os.path.dirname(filepath) for filepath in local_filepaths}:
+        os.makedirs(name=directory, exist_ok=True)
+
+    _logger.info("Downloading %d files...", len(s3_filepaths))
+    downloads = utilities.thread_map_function(
         function=_download_file_mp,
         function_args=[
-            DownloadFileArgs(
-                s3_filepath=s3_filepath, local_directory=local_directory, s3_filesystem=s3
-            )
-            for s3_filepath in s3_filepaths
+            DownloadFileArgs(s3_filepath=s3_filepath, local_path=local_path)
+            for s3_filepath, local_path in zip(s3_filepaths, local_filepaths)
         ],
+        max_workers=MAX_CONCURRENT_DOWNLOADS,
     )
-    _logger.info(
-        "Downloaded %.5f GB of satellite data.",
-        sum(os.path.getsize(f) for f in local_filepaths) / 1e9,
-    )
-    return local_filepaths
+    total_bytes = 0
+    for _, num_bytes in downloads:
+        total_bytes += num_bytes
+    _logger.info("Downloaded %.5f GB of satellite data.", total_bytes / 1e9)
+    return [local_filepath for local_filepath, _ in downloads]
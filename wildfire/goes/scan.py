@@ -1,6 +1,9 @@
 """Wrapper around the 16 bands of a GOES satellite scan."""
+import collections
+import concurrent.futures
 import datetime
 import math
+import operator
 
 import matplotlib.pyplot as plt
 import numpy as np
@@ -80,6 +83,49 @@ def read_netcdfs(local_filepaths, transform_func=None):
     )
 
 
+def read_netcdfs_prefetched(scans_filepaths, transform_func=None, num_prefetched=1):
+    """Read a sequence of scans from the local filesystem, reading ahead of the caller.
+
+    While the caller works on one scan, up to `num_prefetched` of the following scans
+    are queued for reading, overlapping file I/O with the caller's processing. Reads
+    happen one at a time on a single background thread, since the netcdf C library is
+    not thread-safe; callers should not read netcdf files themselves while iterating.
+
+    Scans are read fully into memory, so up to `num_prefetched + 1` scans (the one the
+    caller holds plus those queued) are held at once. For full disk and CONUS scans,
+    keep `num_prefetched` small when running many readers side by side.
+
+    Parameters
+    ----------
+    scans_filepaths : list of list of str
+        Each sublist defines a scan, as accepted by `read_netcdfs()`.
+    transform_func : function
+        (xr.core.dataset.Dataset) -> (xr.core.dataset.Dataset)
+    num_prefetched : int, optional
+        Number of scans to read ahead. By default 1.
+
+    Yields
+    ------
+    concurrent.futures.Future
+        One future per element of `scans_filepaths`, in order, resolving to a GoesScan.
+        Calling `result()` re-raises any error met while reading that scan.
+    """
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+        in_flight = collections.deque()
+        for filepaths in scans_filepaths:
+            in_flight.append(
+                executor.submit(
+                    read_netcdfs,
+                    local_filepaths=filepaths,
+                    transform_func=transform_func,
+                )
+            )
+            if len(in_flight) > num_prefetched:
+                yield in_flight.popleft()
+        while in_flight:
+            yield in_flight.popleft()
+
+
 class GoesScan:
     """Wrapper around the 16 bands of a GOES satellite scan.
 
@@ -159,11 +205,13 @@ class GoesScan:
             A dictionary of GOES satellite data, ordered by band number from smallest to
             greatest.
         """
-        parsed = {band.band_id: band for band in bands}
-        _assert_no_missing_bands(bands=parsed)
+        _assert_no_missing_bands(bands=bands)
         _assert_16_bands(bands=bands)
         _assert_consistent_attributes(bands=bands)
-        return {f"band_{band_id}": parsed[band_id] for band_id in list(range(1, 17))}
+        # bands usually arrive ordered, in which case there is no need to sort
+        if any(first.band_id > second.band_id for first, second in zip(bands, bands[1:])):
+            bands = sorted(bands, key=operator.attrgetter("band_id"))
+        return {f"band_{band.band_id}": band for band in bands}
 
     @property
     def keys(self):
@@ -202,7 +250,7 @@ class GoesScan:
         rescaled_datasets = [band.rescale_to_500m() for _, band in self.iteritems()]
         return GoesScan(bands=rescaled_datasets)
 
-    def to_netcdf(self, directory):
+    def to_netcdf(self, directory, num_workers=1):
         """Persist a netcdf4 per band.
 
         Persists files in a form matching the file struture in Amazon S3:
@@ -215,16 +263,32 @@ class GoesScan:
         ----------
         directory : str
             Path to local directory in which to persist the datasets.
+        num_workers : int, optional
+            Number of processes to write bands with, capped at one per band. By default
+            1, which writes the bands one after another in the current process.
 
         Returns
         -------
         list of str
             The filepaths of the persisted files.
+
+        Notes
+        -----
+        With `num_workers` greater than 1, each band's dataset is pickled to a worker
+        process, and this must not be called from inside a `multiprocessing.Pool`
+        worker, whose daemonic processes cannot start a pool of their own.
         """
-        filepaths = []
-        for _, goes_band in self.iteritems():
-            filepaths.append(goes_band.to_netcdf(directory=directory))
-        return filepaths
+        num_workers = min(num_workers, len(self.bands))
+        if num_workers <= 1:
+            return [
+                goes_band.to_netcdf(directory=directory)
+                for _, goes_band in self.iteritems()
+            ]
+        return utilities.starmap_function(
+            function=band.GoesBand.to_netcdf,
+            function_args=[(goes_band, directory) for _, goes_band in self.iteritems()],
+            num_workers=num_workers,
+        )
 
     def plot(self, bands=range(1, 17), use_radiance=False):
         """Plot the specified bands.
@@ -275,7 +339,7 @@ def _assert_correct_bands(bands):
 
 
 def _assert_no_missing_bands(bands):
-    missing_bands = set(range(1, 17)) - set(bands.keys())
+    missing_bands = set(range(1, 17)) - {band.band_id for band in bands}
     if missing_bands:
         raise ValueError(f"Missing bands: {missing_bands}")
 
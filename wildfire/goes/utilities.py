@@ -1,4 +1,5 @@
 """Common utilities for modules in the goes subpackage."""
+import concurrent.futures
 import datetime
 import glob
 import logging
@@ -18,6 +19,7 @@ BASE_PATTERN_FORMAT = os.path.join(
     "{hour}",
     "OR_ABI-L1b-Rad{region}-M?C{channel}_{satellite_short}_s{start_time}*.nc",
 )
+SCAN_START_REGEX = re.compile(r"_s(\d{14})_e")
 
 _logger = logging.getLogger(__name__)
 
@@ -36,9 +38,9 @@ def group_filepaths_into_scans(filepaths):
     list of list of str
         Each sublist is a specific scan.
     """
-    scan_times = [parse_filename(filepath)[3] for filepath in filepaths]
-    unique_scan_times, unique_indices = np.unique(scan_times, return_inverse=True)
-    groups = [[] for i in range(len(unique_scan_times))]
+    scan_starts = _parse_scan_starts(filepaths=filepaths)
+    unique_scan_starts, unique_indices = np.unique(scan_starts, return_inverse=True)
+    groups = [[] for i in range(len(unique_scan_starts))]
     for scan_time_idx, unique_idx in enumerate(unique_indices):
         groups[unique_idx].append(filepaths[scan_time_idx])
     return groups
@@ -164,11 +166,67 @@ def filter_filepaths(filepaths, start_time, end_time):
     -------
     list of str
     """
-    return [
-        filepath
-        for filepath in filepaths
-        if start_time <= parse_filename(filename=filepath)[3] <= end_time
-    ]
+    earliest, latest = scan_time_bounds(start_time=start_time, end_time=end_time)
+    scan_starts = _parse_scan_starts(filepaths=filepaths)
+    in_range = (scan_starts >= earliest) & (scan_starts <= latest)
+    return [filepath for filepath, keep in zip(filepaths, in_range) if keep]
+
+
+def scan_time_bounds(start_time, end_time=None):
+    """Translate a time range into bounds on the scan start time found in filenames.
+
+    Filenames encode the scan start time as `%Y%j%H%M%S` followed by tenths of a
+    second (e.g. `s20193002048275`), which read as an integer orders chronologically.
+    Comparing these integers avoids building a `datetime.datetime` per filename.
+
+    Parameters
+    ----------
+    start_time : datetime.datetime
+    end_time : datetime.datetime, optional
+        By default `None`, which bounds every scan starting in the same minute as
+        `start_time`.
+
+    Returns
+    -------
+    tuple of (int, int)
+        Inclusive lower and upper bounds.
+    """
+    if end_time is None:
+        minute = int(start_time.strftime("%Y%j%H%M"))
+        return minute * 1000, minute * 1000 + 599
+
+    # round the start up to the next tenth of a second so the comparison stays exact
+    start_time += datetime.timedelta(microseconds=-start_time.microsecond % 100000)
+    return int(format_scan_time(start_time)), int(format_scan_time(end_time))
+
+
+def format_scan_time(scan_time):
+    """Format a time the way filenames encode the scan start time.
+
+    Parameters
+    ----------
+    scan_time : datetime.datetime
+
+    Returns
+    -------
+    str
+        `%Y%j%H%M%S` followed by tenths of a second (truncated), e.g. `20193002048275`.
+    """
+    return scan_time.strftime("%Y%j%H%M%S") + str(scan_time.microsecond // 100000)
+
+
+def _parse_scan_starts(filepaths):
+    """Parse the scan start time of each filepath as in `scan_time_bounds()`.
+
+    Returns
+    -------
+    np.ndarray of np.int64
+    """
+    return np.fromiter(
+        (int(SCAN_START_REGEX.search(filepath).group(1)) for filepath in filepaths),
+        dtype=np.int64,
+        count=len(filepaths),
+    )
 
 
 def list_local_files(
@@ -204,7 +262,10 @@ def list_local_files(
         start_time=start_time,
         end_time=end_time,
     )
-    filepaths = imap_function(glob.glob, glob_patterns, flatten=True)
+    if len(glob_patterns) == 1:  # e.g. a single scan, not worth starting a pool for
+        filepaths = glob.glob(glob_patterns[0])
+    else:
+        filepaths = thread_map_function(glob.glob, glob_patterns, flatten=True)
     if end_time is not None:
         return filter_filepaths(
             filepaths=filepaths, start_time=start_time, end_time=end_time,
@@ -319,12 +380,53 @@ def imap_function(function, function_args, flatten=False):
     return worker_results
 
 
-def starmap_function(function, function_args, flatten=False):
+def thread_map_function(function, function_args, flatten=False, max_workers=64):
+    """Map function arguments across function concurrently in threads.
+
+    Meant for I/O-bound functions (e.g. network requests or globbing a filesystem),
+    where workers spend their time waiting rather than holding the GIL. Unlike the
+    multiprocessing helpers, arguments are not pickled and many more workers than cores
+    can be kept busy. Logs a progress bar over its progress.
+
+    https://docs.python.org/3/library/concurrent.futures.html#threadpoolexecutor
+
+    Parameters
+    ----------
+    function : function
+        Function to run across multiple threads. Must be thread-safe.
+    function_args : list of Any
+        Arguments to iteratively pass to `function` across multiple threads. Only
+        supports one iterable argument.
+    flatten : bool, optional
+        Whether to flatten a nested list to 1 dimenstion. By default False, which will
+        not flatten.
+    max_workers : int, optional
+        Maximum number of threads. By default 64.
+
+    Returns
+    -------
+    list of Any
+        A list over the return values of `function` across the number of threads.
+        Length is equal to `len(function_args)`.
+    """
+    _logger.info("Using %s threads to run %s...", max_workers, function.__name__)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        worker_map = executor.map(function, function_args)
+        worker_results = list(
+            tqdm.tqdm(worker_map, total=len(function_args), desc=function.__name__)
+        )
+
+    if flatten:
+        return _flatten(worker_results)
+    return worker_results
+
+
+def starmap_function(function, function_args, flatten=False, num_workers=None):
     """Map function arguments across function in parallel.
 
-    Uses the number of cores available on the machine as the number of workers. Uses
-    multiprocessing's `starmap`. Starmap allows for `function`s that take multiple
-    arguments.
+    By default uses the number of cores available on the machine as the number of
+    workers. Uses multiprocessing's `starmap`. Starmap allows for `function`s that take
+    multiple arguments.
 
     https://docs.python.org/3/library/multiprocessing.html#multiprocessing.pool.Pool.starmap
 
@@ -341,6 +443,8 @@ def starmap_function(function, function_args, flatten=False):
     flatten : bool, optional
         Whether to flatten a nested list to 1 dimenstion. By default False, which will
         not flatten.
+    num_workers : int, optional
+        Number of worker processes. By default `None`, which uses the number of cores.
 
     Returns
     -------
@@ -348,10 +452,9 @@ def starmap_function(function, function_args, flatten=False):
         A list over the return values of `function` across the number of threads.
         Length is equal to `len(function_args)`.
     """
-    _logger.info(
-        "Using %s workers to run %s...", multiprocessing.cpu_count(), function.__name__
-    )
-    pool = multiprocessing.Pool()
+    num_workers = num_workers if num_workers is not None else multiprocessing.cpu_count()
+    _logger.info("Using %s workers to run %s...", num_workers, function.__name__)
+    pool = multiprocessing.Pool(processes=num_workers)
     worker_results = pool.starmap(function, function_args)
     pool.close()
     pool.join()
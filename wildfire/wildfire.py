@@ -76,7 +76,49 @@ def parse_scan_for_wildfire(filepaths):
             error_message,
         )
         return None
+    return _label_wildfire(goes_scan=goes_scan)
 
+
+def parse_scans_for_wildfires(scans_filepaths, num_prefetched=1):
+    """Determine which of the scans defined by `scans_filepaths` have a wildfire.
+
+    Scans are processed one after another in the current process, while the following
+    scans are read from disk in the background.
+
+    Parameters
+    ----------
+    scans_filepaths : list of list of str
+        Each sublist must be a set of 16 files, which together define the 16 bands of a
+        complete scan.
+    num_prefetched : int, optional
+        Number of scans to read ahead of the one being processed. Each holds a fully
+        read scan in memory. By default 1.
+
+    Returns
+    -------
+    list of dict
+        List of wildfires of the same form returned by `parse_scan_for_wildfire`.
+    """
+    wildfires = []
+    goes_scans = scan.read_netcdfs_prefetched(
+        scans_filepaths=scans_filepaths, num_prefetched=num_prefetched
+    )
+    for filepaths, goes_scan in zip(scans_filepaths, goes_scans):
+        try:
+            scan_wildfire = _label_wildfire(goes_scan=goes_scan.result())
+        except (OSError, ValueError) as error_message:
+            _logger.warning(
+                "\nSkipping malformed goes_scan comprised of %s.\nError: %s",
+                filepaths,
+                error_message,
+            )
+            continue
+        if scan_wildfire is not None:
+            wildfires.append(scan_wildfire)
+    return wildfires
+
+
+def _label_wildfire(goes_scan):
     if predict_wildfires_goes(goes_scan=goes_scan).mean() > 0:
         return {
             "scan_time_utc": goes_scan.scan_time_utc.strftime("%Y-%m-%dT%H:%M:%S%f"),